@@ -1,4 +1,4 @@
-from app.services.analyze_service import AnalyzeService
+from app.services.warmup_service import warmup_service
 from fastapi import APIRouter, UploadFile, File
 from fastapi.responses import JSONResponse
 
@@ -6,11 +6,20 @@ router = APIRouter()
 
 @router.post("/")
 async def analyze(file: UploadFile = File(...), metamodel: UploadFile = File(None)):
-    try:        
+    # Falha permanente no warm-up (500) é diferente de "ainda carregando" (503, tentar de novo)
+    if warmup_service.error:
+        return JSONResponse(status_code=500, content={"error": f"Falha ao carregar os modelos de IA: {warmup_service.error}"})
+    if not warmup_service.ready:
+        return JSONResponse(status_code=503, content={"error": "Modelos de IA ainda estão carregando. Tente novamente em instantes."})
+
+    try:
+        # Import tardio: o AnalyzeService puxa ultralytics/torch e LangChain (já carregados pelo warm-up)
+        from app.services.analyze_service import AnalyzeService
+
         service = AnalyzeService()
         report = await service.analyze(file, metamodel)
 
-        return JSONResponse(content={"report": report})        
+        return JSONResponse(content={"report": report})
     except Exception as e:
         print(f"Erro: {e}")
-        return JSONResponse(status_code=500, content={"error": str(e)})
\ No newline at end of file
+        return JSONResponse(status_code=500, content={"error": str(e)})
@@ -1,7 +1,18 @@
+from app.services.warmup_service import warmup_service
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 router = APIRouter()
 
 @router.get("/")
 async def health():
-    return {"status": "ok", "message": "API is healthy and running."}
\ No newline at end of file
+    return {"status": "ok", "message": "API is healthy and running."}
+
+@router.get("/ready")
+async def ready():
+    # Liveness (/health) responde desde o boot; readiness só após o warm-up dos modelos de IA
+    status = warmup_service.status()
+    if not warmup_service.ready:
+        state = "error" if warmup_service.error else "loading"
+        return JSONResponse(status_code=503, content={"status": state, **status})
+    return {"status": "ready", **status}
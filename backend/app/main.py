@@ -1,6 +1,12 @@
+import time
+_boot_start = time.perf_counter()
+
+import asyncio
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 from pathlib import Path
 from app.api.routes import router as api_router
+from app.services.warmup_service import warmup_service
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import HTMLResponse
@@ -9,7 +15,16 @@ from fastapi.middleware.cors import CORSMiddleware
 # Carrega variáveis de ambiente (.env)
 load_dotenv()
 
-app = FastAPI(title="Diagram Analysis API")
+@asynccontextmanager
+async def lifespan(app):
+    # Rotas leves e health já respondem; os módulos de IA carregam em segundo plano
+    warmup_service.boot_time = time.perf_counter() - _boot_start
+    # Guardamos a referência só para a task não ser coletada. Uma thread do asyncio.to_thread não pode
+    # ser cancelada: um shutdown (ou --reload) durante o warm-up espera os imports terminarem.
+    warmup_task = asyncio.create_task(asyncio.to_thread(warmup_service.warmup))
+    yield
+
+app = FastAPI(title="Diagram Analysis API", lifespan=lifespan)
 
 # Configurar CORS
 app.add_middleware(
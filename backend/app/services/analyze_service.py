@@ -20,7 +20,8 @@ class AnalyzeService:
             shutil.copyfileobj(file.file, tmp)
             return tmp.name
 
-    def _get_model_path(self):
+    @staticmethod
+    def _get_model_path():
         base_dir = os.path.dirname(os.path.abspath(__file__))
         model_path = os.path.join(base_dir, "..", "core", "best.pt")
         if not os.path.exists(model_path):
@@ -0,0 +1,69 @@
+import importlib
+import time
+
+class WarmupService:
+    # Módulos pesados carregados fora do boot, em ordem. Cada tempo medido é incremental:
+    # o que já foi importado por um módulo anterior não é contado de novo.
+    HEAVY_MODULES = [
+        "torch",
+        "ultralytics",
+        "langchain_core.messages",
+        "langchain_ollama",
+        "app.services.analyze_service",
+    ]
+
+    def __init__(self):
+        self.ready = False
+        self.error = None
+        self.import_times = {}
+        self.boot_time = None
+        self.warmup_time = None
+
+    def warmup(self):
+        """
+        Importa os módulos de ML/LLM (YOLO, torch, LangChain) registrando o tempo de cada um e
+        confere se os pesos do YOLO (app/core/best.pt) existem, para não reportar "pronto" sem o modelo.
+        Executado em segundo plano para que a API (e o /api/health) respondam imediatamente.
+        """
+        print(f" > Iniciando warm-up dos módulos de IA...")
+        start = time.perf_counter()
+        try:
+            for module in self.HEAVY_MODULES:
+                module_start = time.perf_counter()
+                importlib.import_module(module)
+                self.import_times[module] = time.perf_counter() - module_start
+
+            from app.services.analyze_service import AnalyzeService
+            AnalyzeService._get_model_path()
+            self.ready = True
+        except Exception as e:
+            print(f"Erro no warm-up: {e}")
+            self.error = str(e)
+        finally:
+            self.warmup_time = time.perf_counter() - start
+            self.report()
+
+    def report(self):
+        """
+        Imprime o perfil de inicialização (tempo de import por módulo) para tornar regressões visíveis.
+        """
+        print(" > Perfil de inicialização:")
+        if self.boot_time is not None:
+            print(f"   {'boot (rotas leves + health)':<32} {self.boot_time * 1000:>9.1f} ms")
+        for module, seconds in self.import_times.items():
+            print(f"   {module:<32} {seconds * 1000:>9.1f} ms")
+        if self.warmup_time is not None:
+            status = "pronto" if self.ready else f"falhou ({self.error})"
+            print(f"   {'warm-up total':<32} {self.warmup_time * 1000:>9.1f} ms - {status}")
+
+    def status(self):
+        return {
+            "ready": self.ready,
+            "error": self.error,
+            "boot_ms": round(self.boot_time * 1000, 1) if self.boot_time is not None else None,
+            "warmup_ms": round(self.warmup_time * 1000, 1) if self.warmup_time is not None else None,
+            "import_ms": {module: round(seconds * 1000, 1) for module, seconds in self.import_times.items()},
+        }
+
+# Instância única compartilhada entre o main.py e os controllers
+warmup_service = WarmupService()
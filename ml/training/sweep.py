@@ -0,0 +1,340 @@
+import argparse
+import csv
+import itertools
+import json
+import multiprocessing
+import os
+import queue
+import random
+import shutil
+import statistics
+import threading
+import time
+
+import psutil
+import yaml
+from ultralytics import YOLO
+from ultralytics.cfg import DEFAULT_CFG
+from ultralytics.models.yolo.detect import DetectionTrainer
+
+from train import AUGMENTATION_ARGS
+
+# ==========================================
+#        CONFIGURAÇÕES DO SWEEP
+# ==========================================
+
+BASE_DIR = os.path.dirname(__file__)
+DATASET_PATH = os.path.join(BASE_DIR, "..", "database", "dataset_yolo")
+SWEEP_DIR = os.path.join(BASE_DIR, "Sweep")
+SUBSET_PATH = os.path.join(SWEEP_DIR, "subset")
+
+# Subconjunto fixo (mesma semente => mesmas imagens em todas as execuções)
+SUBSET_SEED = 42
+SUBSET_TRAIN = 64
+SUBSET_VAL = 16
+
+# Variantes padrão (produto cartesiano entre todas as listas)
+DEFAULT_MODELS = ["yolov8n.pt", "yolov8s.pt"]
+DEFAULT_IMGSZ = [320, 640]
+DEFAULT_CACHE = ["ram", "disk"]
+DEFAULT_WORKERS = [0, 4]
+
+EPOCHS = 3
+BATCH = 16              # Batch fixo: o AutoBatch não se aplica em CPU e atrapalharia a comparação
+LATENCY_RUNS = 20       # Inferências cronometradas por variante (após aquecimento)
+MEMORY_POLL_INTERVAL = 0.1
+
+RESULT_COLUMNS = ["name", "model", "imgsz", "cache", "workers", "loader_workers", "epoch_s", "stall_s", "stall_pct",
+                  "peak_mem_mb", "latency_ms", "map50", "map50_95", "error"]
+
+
+def build_subset(n_train, n_val):
+    """
+    Copia um subconjunto fixo do dataset para SUBSET_PATH e gera um data.yaml próprio.
+    O data.yaml original aponta para um caminho absoluto da máquina de quem gerou o dataset.
+    """
+    if os.path.exists(SUBSET_PATH): shutil.rmtree(SUBSET_PATH)
+    rng = random.Random(SUBSET_SEED)
+
+    for split, count in (("train", n_train), ("val", n_val)):
+        images_dir = os.path.join(DATASET_PATH, "images", split)
+        labels_dir = os.path.join(DATASET_PATH, "labels", split)
+        images = sorted(os.listdir(images_dir))
+        chosen = rng.sample(images, min(count, len(images)))
+
+        os.makedirs(os.path.join(SUBSET_PATH, "images", split))
+        os.makedirs(os.path.join(SUBSET_PATH, "labels", split))
+        for img in chosen:
+            label = os.path.splitext(img)[0] + ".txt"
+            shutil.copy2(os.path.join(images_dir, img), os.path.join(SUBSET_PATH, "images", split, img))
+            if os.path.exists(os.path.join(labels_dir, label)):
+                shutil.copy2(os.path.join(labels_dir, label), os.path.join(SUBSET_PATH, "labels", split, label))
+
+    with open(os.path.join(DATASET_PATH, "data.yaml")) as f:
+        names = yaml.safe_load(f)["names"]
+
+    data_yaml = os.path.join(SUBSET_PATH, "data.yaml")
+    with open(data_yaml, "w") as f:
+        yaml.safe_dump({
+            "path": os.path.abspath(SUBSET_PATH),
+            "train": "images/train",
+            "val": "images/val",
+            "names": names,
+        }, f)
+    return data_yaml
+
+
+class MemoryMonitor:
+    """
+    Amostra a memória do processo + processos filhos (workers do dataloader) em uma thread
+    e guarda o pico. Do processo principal conta o RSS; dos workers só o USS (memória exclusiva),
+    já que bibliotecas do torch e o cache="ram" são compartilhados com o pai via fork e
+    seriam contados uma vez por worker. Cada variante roda em um processo próprio
+    (ver run_variant_isolated), então o pico não herda memória de variantes anteriores.
+    """
+    def __init__(self, interval=MEMORY_POLL_INTERVAL):
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _footprint(self):
+        proc = psutil.Process()
+        total = proc.memory_info().rss
+        for child in proc.children(recursive=True):
+            try:
+                total += child.memory_full_info().uss
+            except psutil.Error:
+                pass
+        return total
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._footprint())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+class SweepTrainer(DetectionTrainer):
+    """
+    O BaseTrainer força workers=0 quando o device é CPU/MPS, o que anularia a variação de
+    workers do sweep. Aqui o valor pedido é restaurado após a inicialização.
+    """
+    def __init__(self, cfg=DEFAULT_CFG, overrides=None, _callbacks=None):
+        super().__init__(cfg, overrides, _callbacks)
+        if overrides and "workers" in overrides:
+            self.args.workers = overrides["workers"]
+
+
+class ThroughputCallbacks:
+    """
+    Callbacks do trainer do Ultralytics para medir tempo de época e espera pelo dataloader.
+    O 'on_train_batch_start' dispara logo após o lote ser entregue, então o intervalo entre o
+    fim do lote anterior (ou início da época) e esse evento é o tempo parado esperando dados.
+    """
+    def __init__(self):
+        self.epoch_times = []
+        self.stall_times = []
+        self.loader_workers = None
+        self._epoch_start = None
+        self._last_mark = None
+        self._stall = 0.0
+
+    def on_train_epoch_start(self, trainer):
+        self._epoch_start = self._last_mark = time.perf_counter()
+        self._stall = 0.0
+        # O Ultralytics ainda limita os workers por os.cpu_count() e pelo número de lotes
+        self.loader_workers = trainer.train_loader.num_workers
+
+    def on_train_batch_start(self, trainer):
+        self._stall += time.perf_counter() - self._last_mark
+
+    def on_train_batch_end(self, trainer):
+        self._last_mark = time.perf_counter()
+
+    def on_train_epoch_end(self, trainer):
+        self.epoch_times.append(time.perf_counter() - self._epoch_start)
+        self.stall_times.append(self._stall)
+
+    def register(self, model):
+        for event in ("on_train_epoch_start", "on_train_batch_start", "on_train_batch_end", "on_train_epoch_end"):
+            model.add_callback(event, getattr(self, event))
+
+
+def measure_latency(model, data_yaml, imgsz, runs=LATENCY_RUNS):
+    """ Latência mediana (ms) de inferência em CPU sobre as imagens de validação do subconjunto. """
+    val_dir = os.path.join(os.path.dirname(data_yaml), "images", "val")
+    # cache="disk" grava arquivos .npy ao lado das imagens
+    images = [os.path.join(val_dir, f) for f in sorted(os.listdir(val_dir)) if f.lower().endswith((".jpg", ".jpeg", ".png"))]
+
+    # Aquecimento (fusão de camadas, alocação inicial)
+    model(images[0], imgsz=imgsz, device="cpu", verbose=False)
+
+    timings = []
+    for i in range(runs):
+        start = time.perf_counter()
+        model(images[i % len(images)], imgsz=imgsz, device="cpu", verbose=False)
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def variant_name(variant, model_index):
+    # O índice do --models evita colisão entre pesos com o mesmo nome (ex: dois best.pt),
+    # que gravariam no mesmo diretório do Sweep (exist_ok=True)
+    model_name = os.path.splitext(os.path.basename(variant["model"]))[0]
+    return f"{model_index}_{model_name}_{variant['imgsz']}_{variant['cache']}_w{variant['workers']}"
+
+
+def run_variant(variant, name, data_yaml, epochs):
+    print(f"\n⏳ Variante: {name}")
+
+    model = YOLO(variant["model"])
+    callbacks = ThroughputCallbacks()
+    callbacks.register(model)
+
+    # O treino real (120 épocas, close_mosaic=10) passa quase todas as épocas com mosaic/mixup/copy_paste.
+    # Com poucas épocas o close_mosaic desligaria tudo já na época 0, medindo o dataloader mais barato.
+    train_args = {**AUGMENTATION_ARGS, "close_mosaic": 0}
+
+    with MemoryMonitor() as memory:
+        model.train(
+            trainer=SweepTrainer,
+            data=data_yaml,
+            project=SWEEP_DIR,
+            name=name,
+            imgsz=variant["imgsz"],
+            epochs=epochs,
+            batch=BATCH,
+            device="cpu",
+            workers=variant["workers"],
+            cache=False if variant["cache"] == "none" else variant["cache"],
+            **train_args,
+            optimizer='AdamW',
+            seed=SUBSET_SEED,
+            deterministic=True,
+            plots=False,
+            exist_ok=True,
+        )
+
+    best = YOLO(os.path.join(SWEEP_DIR, name, "weights", "best.pt"))
+    metrics = best.val(data=data_yaml, imgsz=variant["imgsz"], batch=BATCH, device="cpu", plots=False, verbose=False)
+
+    epoch_time = statistics.mean(callbacks.epoch_times)
+    stall_time = statistics.mean(callbacks.stall_times)
+    return {
+        "name": name,
+        **variant,
+        "loader_workers": callbacks.loader_workers,
+        "epoch_s": round(epoch_time, 2),
+        "stall_s": round(stall_time, 2),
+        "stall_pct": round(100 * stall_time / epoch_time, 1) if epoch_time else 0.0,
+        "peak_mem_mb": round(memory.peak / 2**20),
+        "latency_ms": round(measure_latency(best, data_yaml, variant["imgsz"]), 1),
+        "map50": round(float(metrics.box.map50), 4),
+        "map50_95": round(float(metrics.box.map), 4),
+        "error": "",
+    }
+
+
+def _variant_process(variant, name, data_yaml, epochs, start_method, results_queue):
+    # O processo criado via spawn herda "spawn" como método padrão, o que mudaria como o DataLoader
+    # cria os workers (sem compartilhar memória com o pai). Restaura o padrão da plataforma (fork no Linux).
+    multiprocessing.set_start_method(start_method, force=True)
+    try:
+        results_queue.put(run_variant(variant, name, data_yaml, epochs))
+    except Exception as e:
+        results_queue.put({"error": f"{type(e).__name__}: {e}"})
+
+
+def run_variant_isolated(variant, name, data_yaml, epochs):
+    """
+    Executa a variante em um processo separado: isola a medição de memória e impede que
+    uma falha (OOM com cache=ram, best.pt ausente, etc.) derrube o sweep inteiro.
+    """
+    start_method = multiprocessing.get_start_method()
+    ctx = multiprocessing.get_context("spawn")
+    results_queue = ctx.Queue()
+    proc = ctx.Process(target=_variant_process, args=(variant, name, data_yaml, epochs, start_method, results_queue))
+    proc.start()
+    proc.join()
+
+    try:
+        result = results_queue.get(timeout=5)
+    except queue.Empty:
+        result = {"error": f"Processo encerrado sem resultado (exit code {proc.exitcode})"}
+
+    if result["error"]:
+        print(f"❌ Variante {name} falhou: {result['error']}")
+        return {**dict.fromkeys(RESULT_COLUMNS, ""), "name": name, **variant, "error": result["error"]}
+    return result
+
+
+def print_table(results, min_map50):
+    columns = ["name", "loader_workers", "epoch_s", "stall_s", "stall_pct", "peak_mem_mb", "latency_ms", "map50", "map50_95"]
+    print("\n| " + " | ".join(columns) + " |")
+    print("|" + "|".join(" --- " for _ in columns) + "|")
+    succeeded = [r for r in results if not r["error"]]
+    for r in sorted(succeeded, key=lambda r: r["latency_ms"]):
+        print("| " + " | ".join(str(r[c]) for c in columns) + " |")
+    for r in results:
+        if r["error"]:
+            print(f"| {r['name']} | " + " | ".join("-" for _ in columns[1:]) + " |")
+
+    # Mais rápida (em inferência, que é o que importa para o backend) que atinge a meta de precisão
+    eligible = [r for r in succeeded if r["map50"] >= min_map50]
+    if eligible:
+        best = min(eligible, key=lambda r: r["latency_ms"])
+        print(f"\n✅ Mais rápida com mAP50 >= {min_map50}: {best['name']} ({best['latency_ms']} ms, mAP50 {best['map50']})")
+    else:
+        print(f"\n⚠️ Nenhuma variante atingiu mAP50 >= {min_map50}.")
+
+
+def save_results(results):
+    with open(os.path.join(SWEEP_DIR, "sweep_results.json"), "w") as f:
+        json.dump(results, f, indent=2)
+    with open(os.path.join(SWEEP_DIR, "sweep_results.csv"), "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=RESULT_COLUMNS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sweep de hiperparâmetros e throughput do treino YOLO (CPU).")
+    parser.add_argument("--models", nargs="+", default=DEFAULT_MODELS, help="Pesos iniciais (ex: yolov8n.pt ou um best.pt para fine-tuning)")
+    parser.add_argument("--imgsz", nargs="+", type=int, default=DEFAULT_IMGSZ)
+    parser.add_argument("--cache", nargs="+", choices=["ram", "disk", "none"], default=DEFAULT_CACHE)
+    parser.add_argument("--workers", nargs="+", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--epochs", type=int, default=EPOCHS)
+    parser.add_argument("--train-size", type=int, default=SUBSET_TRAIN)
+    parser.add_argument("--val-size", type=int, default=SUBSET_VAL)
+    parser.add_argument("--min-map50", type=float, default=0.5, help="Meta mínima de mAP50 para recomendar uma variante")
+    return parser.parse_args()
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    data_yaml = build_subset(args.train_size, args.val_size)
+    print(f"Subconjunto fixo: {args.train_size} treino / {args.val_size} validação (seed {SUBSET_SEED})")
+
+    variants = [
+        (model_index, {"model": m, "imgsz": i, "cache": c, "workers": w})
+        for (model_index, m), i, c, w in itertools.product(enumerate(args.models), args.imgsz, args.cache, args.workers)
+    ]
+
+    # Resultados salvos a cada variante para não perder o que já rodou se o sweep for interrompido
+    results = []
+    for model_index, variant in variants:
+        name = variant_name(variant, model_index)
+        results.append(run_variant_isolated(variant, name, data_yaml, args.epochs))
+        save_results(results)
+
+    print_table(results, args.min_map50)
+    print(f"📁 Resultados salvos em {os.path.abspath(SWEEP_DIR)}")
@@ -11,6 +11,26 @@ def get_device():
     else:
         return "cpu"
 
+# Augmentations usadas no treino (compartilhadas com o sweep.py para que as medições
+# de throughput reflitam o custo de carregamento do treino real; o sweep zera o close_mosaic
+# porque, com poucas épocas, ele desligaria o mosaic desde a primeira)
+AUGMENTATION_ARGS = {
+    # --- AUGMENTATION (Mosaic e Scale Ativados) ---
+    "mosaic": 1.0,         # Mistura 4 imagens em 1 (CRUCIAL para variedade)
+    "scale": 0.6,          # Zoom in/out agressivo (0.6 = +/- 60% de zoom)
+    
+    # --- Outras Augmentations ---
+    "degrees": 10.0,       # Rotação
+    "mixup": 0.15,         # Transparência
+    "copy_paste": 0.3,     # Recorte e cola
+    "close_mosaic": 10,    # Desliga mosaic no fim para refinar
+    
+    # --- Ajustes de Cor ---
+    "hsv_h": 0.015,        # Matiz conservador
+    "hsv_s": 0.8,          # Saturação agressiva (para ícones 'lavados')
+    "hsv_v": 0.4,          # Brilho
+}
+
 if __name__ == '__main__':
     # Carrega modelo
     model = YOLO("yolov8n.pt") 
@@ -34,21 +54,8 @@ if __name__ == '__main__':
         epochs=120,        # Para 8000 imagens, 100 épocas é um bom número inicial.
         patience=20,       # Se não melhorar em 15 épocas, ele para (economiza tempo).
         
-        # --- AUGMENTATION (Mosaic e Scale Ativados) ---
-        mosaic=1.0,         # Mistura 4 imagens em 1 (CRUCIAL para variedade)
-        scale=0.6,          # Zoom in/out agressivo (0.6 = +/- 60% de zoom)
-        
-        # --- Outras Augmentations ---
-        degrees=10.0,       # Rotação
-        mixup=0.15,         # Transparência
-        copy_paste=0.3,     # Recorte e cola
-        close_mosaic=10,    # Desliga mosaic no fim para refinar
-        
-        # --- Ajustes de Cor ---
-        hsv_h=0.015,        # Matiz conservador
-        hsv_s=0.8,          # Saturação agressiva (para ícones 'lavados')
-        hsv_v=0.4,          # Brilho
-        
+        **AUGMENTATION_ARGS,
+
         # --- Otimização ---
         batch=-1,           # AutoBatch
         device=device,      # Usa GPU se disponível